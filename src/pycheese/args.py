@@ -8,7 +8,9 @@ def get_argparser():
     parser.add_argument(
         "--file",
         type=str,
-        help="Path to the .py source file",
+        nargs="+",
+        help="Path to one or more .py source files. Multiple files are "
+        "rendered in parallel, each to a PNG named after its source.",
     )
     parser.add_argument(
         "--style",
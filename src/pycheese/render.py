@@ -1,8 +1,11 @@
 import os
 import sys
-import textwrap
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from itertools import repeat
 from pathlib import Path
+from tokenize import TokenError
 from typing import Optional
 
 from PIL import Image, ImageDraw, ImageFilter
@@ -12,12 +15,28 @@ from pygments.util import ClassNotFound
 
 from pycheese.args import get_argparser
 from pycheese.utils.fonts import Font, font_paths, get_font_config_resource
-from pycheese.utils.image import (
-    Color,
-    create_gradient_background,
-    create_uniform_background,
-)
-from pycheese.utils.linewrap import tokenize, wrap_tokens
+from pycheese.utils.image import Color, create_gradient_background
+from pycheese.utils.linewrap_core import tokenize, tokenize_fast, wrap_tokens
+
+# lexer construction is not free; build the default lexer once
+_PYLEXER = PythonLexer()
+
+
+@lru_cache(maxsize=64)
+def _style_lookup(lookup, style_name):
+    """Resolve a pygments style once per name; get_style_by_name scans
+    entry points and imports the style class on every call.
+
+    Keyed on the lookup callable so a monkeypatched get_style_by_name
+    gets its own cache entries instead of stale real ones.
+    """
+    return lookup(style_name)
+
+
+@lru_cache(maxsize=8)
+def _all_styles(provider):
+    """Cache the style listing; get_all_styles walks entry points."""
+    return tuple(provider())
 
 
 class StyleNotFoundError(ClassNotFound):
@@ -52,6 +71,8 @@ class RenderConfig:
     second_bg_color: str | None = None
     text_background_color: str | None = None
     default_text_color: str | None = None
+    fast_lexer: bool = False
+    glyph_cache: bool = False
     font: Optional[Font] = field(init=False)
 
     def __post_init__(self):
@@ -64,14 +85,25 @@ class RenderConfig:
             path=get_font_config_resource(),
         )
         self.line_height = int(self.font_size * self.line_spacing)
-        self.char_width = self.font.get_ImageFont(size=self.font_size).getlength("M")
+
+    @cached_property
+    def char_width(self):
+        """Advance width of one glyph; parses the TTF on first access."""
+        return self.font.get_ImageFont(size=self.font_size).getlength("M")
+
+    @cached_property
+    def monospace(self):
+        # grid positioning assumes fixed advances; probe a few glyphs so
+        # proportional fonts fall back to measured widths when drawing
+        image_font = self.font.get_ImageFont(size=self.font_size)
+        return all(image_font.getlength(c) == self.char_width for c in "iMW0")
 
     def _validate_style(self):
         """Validate pygments style/theme."""
         try:
-            style_obj = get_style_by_name(self.style)
+            style_obj = _style_lookup(get_style_by_name, self.style)
         except ClassNotFound:
-            available = list(get_all_styles())
+            available = list(_all_styles(get_all_styles))
             raise StyleNotFoundError(self.style, available)
 
         if self.text_background_color is None:
@@ -88,19 +120,66 @@ class RenderConfig:
             self.default_text_color = (255 - r, 255 - g, 255 - b)
 
 
+@lru_cache(maxsize=32)
+def _tokenize_cached(code, style, default_text_color, fast=False):
+    """Tokenize once per (code, style); animation frames re-render the same
+    code repeatedly and lexing is the expensive part."""
+    if fast:
+        try:
+            return tuple(
+                tokenize_fast(code, style=style, default_text_color=default_text_color)
+            )
+        except (TokenError, SyntaxError):
+            pass  # malformed snippet, fall back to the pygments lexer
+    return tuple(
+        tokenize(
+            code,
+            lexer=_PYLEXER,
+            style=style,
+            default_text_color=default_text_color,
+        )
+    )
+
+
+def _merge_token_runs(line):
+    """Merge adjacent tokens sharing color and style into single runs.
+
+    Pygments emits many short neighboring tokens with identical type
+    setting; drawing them as one string saves a text-layout pass per token.
+    """
+    runs = []
+    for token, color, font_style, _, printable_len in line:
+        if printable_len == 0:  # nothing to draw, e.g. a bare "\n"
+            continue
+        if runs and runs[-1][1] == color and runs[-1][2] == font_style:
+            runs[-1][0] += token
+            runs[-1][3] += printable_len
+        else:
+            runs.append([token, color, font_style, printable_len])
+    return runs
+
+
 class Render:
     def __init__(self, config: RenderConfig):
         self.cfg = config
 
-        self.bar_height = 30
-
         self.bg_layer = None
+        self._bg_color = None
         self.shadow_layer = None
         self.text_layer = None
         self.titlebar_layer = None
         self.final_image = None
 
         self._code = None
+        self._terminal_mask = None
+        self._scratch = None
+        self._glyph_cache = {}
+
+        shadow_alpha = self.cfg.shadow_alpha
+        assert 0 <= shadow_alpha <= 255, f"{shadow_alpha=} is outside range [0..255]"
+        self._shadow_fill = Color.from_any_color(self.cfg.shadow_color).rgb + (
+            shadow_alpha,
+        )
 
         self._init_image_properties()
 
@@ -109,7 +188,9 @@ class Render:
             self.cfg.columns * self.cfg.char_width + 2 * self.cfg.padding
         )
         self.window_height = int(
-            self.cfg.rows * self.cfg.line_height + 2 * self.cfg.padding + 30
+            self.cfg.rows * self.cfg.line_height
+            + 2 * self.cfg.padding
+            + self.cfg.bar_height
         )
         self.img_width = int(self.window_width + 2 * self.cfg.margin)
         self.img_height = int(self.window_height + 2 * self.cfg.margin)
@@ -117,11 +198,10 @@ class Render:
     def render_background_layer(self, first_color="white", second_color=None):
         """Render solid or gradient background layer."""
         if second_color is None:
-            self.bg_layer = create_uniform_background(
-                self.img_width,
-                self.img_height,
-                color=first_color,
-            )
+            # solid backgrounds need no layer of their own; the color is
+            # filled straight into the composite buffer
+            self._bg_color = Color.from_any_color(first_color).rgba
+            self.bg_layer = None
         else:
             self.bg_layer = create_gradient_background(
                 self.img_width,
@@ -129,37 +209,46 @@ class Render:
                 start_color=first_color,
                 end_color=second_color,
             )
+            self._bg_color = None
 
-    def render_shadow_layer(
-        self,
-        shadow_offset=10,
-        shadow_blur=6,
-        shadow_color="black",
-        shadow_alpha=180,
-        corner_radius=6,
-    ):
+    def render_shadow_layer(self):
         """Render floating window shadow layer."""
-        rgb = Color.from_any_color(shadow_color).rgb
-        assert 0 <= shadow_alpha <= 255, f"{shadow_alpha=} is outside range [0..255]"
-        rgba = rgb + (shadow_alpha,)
-        shadow = Image.new("RGBA", (self.img_width, self.img_height), (0, 0, 0, 0))
+        shadow_offset = self.cfg.shadow_offset
+        shadow_blur = self.cfg.shadow_blur
+
+        # Draw and blur in a buffer just large enough for the window plus
+        # blur falloff instead of the full canvas; most canvas pixels are
+        # fully transparent and would only inflate the Gaussian pass.
+        pad = 4 * shadow_blur
+        shadow = Image.new(
+            "RGBA",
+            (self.window_width + 2 * pad, self.window_height + 2 * pad),
+            (0, 0, 0, 0),
+        )
         shadow_draw = ImageDraw.Draw(shadow)
         shadow_draw.rounded_rectangle(
-            [
-                self.cfg.margin + shadow_offset,
-                self.cfg.margin + shadow_offset,
-                self.cfg.margin + self.window_width + shadow_offset,
-                self.cfg.margin + self.window_height + shadow_offset,
-            ],
-            radius=corner_radius,
-            fill=(rgba),
+            [pad, pad, pad + self.window_width, pad + self.window_height],
+            radius=self.cfg.corner_radius,
+            fill=self._shadow_fill,
+        )
+        shadow = shadow.filter(ImageFilter.GaussianBlur(shadow_blur))
+        self.shadow_layer = Image.new(
+            "RGBA", (self.img_width, self.img_height), (0, 0, 0, 0)
+        )
+        self.shadow_layer.paste(
+            shadow,
+            (
+                self.cfg.margin + shadow_offset - pad,
+                self.cfg.margin + shadow_offset - pad,
+            ),
         )
-        self.shadow_layer = shadow.filter(ImageFilter.GaussianBlur(shadow_blur))
 
     def render_titlebar_layer(self, color=(30, 30, 30)):
         """Render a stylized terminal window title bar resembling macOS."""
 
-        terminal = Image.new("RGBA", (self.window_width, self.bar_height), (0, 0, 0, 0))
+        terminal = Image.new(
+            "RGBA", (self.window_width, self.cfg.bar_height), (0, 0, 0, 0)
+        )
         terminal_draw = ImageDraw.Draw(terminal)
 
         # Draw top bar with traffic lights
@@ -181,16 +270,35 @@ class Render:
         )
         self.titlebar_layer.paste(terminal, (self.cfg.margin, self.cfg.margin))
 
+    def _glyph(self, char, color, font_style):
+        """RGBA tile of a single glyph, rasterized once and reused.
+
+        Repeated renders (animations, batches) draw the same small set of
+        characters over and over; blitting cached tiles skips the FreeType
+        rasterization that ImageDraw.text pays on every call.
+        """
+        key = (char, color, font_style)
+        glyph = self._glyph_cache.get(key)
+        if glyph is None:
+            image_font = self.cfg.font.get_ImageFont(
+                size=self.cfg.font_size, style=font_style
+            )
+            glyph = Image.new(
+                "RGBA",
+                (int(self.cfg.char_width) + 1, self.cfg.line_height),
+                (0, 0, 0, 0),
+            )
+            ImageDraw.Draw(glyph).text((0, 0), char, font=image_font, fill=color)
+            self._glyph_cache[key] = glyph
+        return glyph
+
     def render_text_layer(self, code, style="monokai", text_background_color=None):
         """Render text area according to style on top of solid background."""
 
-        tokens = tokenize(
-            code,
-            lexer=PythonLexer(),
-            style=style,
-            default_text_color=self.cfg.default_text_color,
+        tokens = _tokenize_cached(
+            code, style, self.cfg.default_text_color, fast=self.cfg.fast_lexer
         )
-        wrapped_lines = wrap_tokens(tokens, width=self.cfg.columns)
+        wrapped_lines = wrap_tokens(list(tokens), width=self.cfg.columns)
 
         if text_background_color is None:
             text_background_color = self.cfg.text_background_color
@@ -203,57 +311,78 @@ class Render:
         )
         terminal_draw = ImageDraw.Draw(terminal)
 
-        # place text
+        # place text; on monospace fonts positions follow from the character
+        # column, proportional fonts fall back to measured advances
+        monospace = self.cfg.monospace
         y = self.cfg.padding + self.cfg.bar_height
         for line in wrapped_lines:
+            col = 0
             x = self.cfg.padding
-            for token, color, font_style, *_ in line:
-                image_font = self.cfg.font.get_ImageFont(
-                    size=self.cfg.font_size, style=font_style
-                )
-                terminal_draw.text((x, y), token, font=image_font, fill=color)
-                x += image_font.getlength(token)
+            for token, color, font_style, printable_len in _merge_token_runs(line):
+                if monospace:
+                    x = self.cfg.padding + col * self.cfg.char_width
+                if monospace and self.cfg.glyph_cache:
+                    for i, char in enumerate(token[:printable_len]):
+                        terminal.alpha_composite(
+                            self._glyph(char, color, font_style),
+                            (int(x + i * self.cfg.char_width), y),
+                        )
+                else:
+                    image_font = self.cfg.font.get_ImageFont(
+                        size=self.cfg.font_size, style=font_style
+                    )
+                    terminal_draw.text((x, y), token, font=image_font, fill=color)
+                    if not monospace:
+                        x += image_font.getlength(token)
+                col += printable_len
             y += self.cfg.line_height
 
-        # create mask to round edges of terminal window
-        mask = Image.new("L", (self.window_width, self.window_height), 0)
-        mask_draw = ImageDraw.Draw(mask)
-        mask_draw.rounded_rectangle(
-            [0, 0, self.window_width, self.window_height],
-            radius=self.cfg.corner_radius,
-            fill=255,
-        )
-        self.text_layer = Image.new(
-            "RGBA",
-            (self.img_width, self.img_height),
-            (0, 0, 0, 0),
-        )
-        self.text_layer.paste(terminal, (self.cfg.margin, self.cfg.margin), mask)
+        # round edges of terminal window via its alpha channel; the mask
+        # only depends on geometry, so build it once and reuse it
+        if self._terminal_mask is None:
+            mask = Image.new("L", (self.window_width, self.window_height), 0)
+            mask_draw = ImageDraw.Draw(mask)
+            mask_draw.rounded_rectangle(
+                [0, 0, self.window_width, self.window_height],
+                radius=self.cfg.corner_radius,
+                fill=255,
+            )
+            self._terminal_mask = mask
+        terminal.putalpha(self._terminal_mask)
+        # keep the layer window-sized; compositing places it at the margin
+        # offset, so no full-canvas intermediate is needed
+        self.text_layer = terminal
 
     def composit_layers(self, blur=0.0):
         """Composit all layers."""
-        self.final_image = self.bg_layer.copy()
-        self.final_image.alpha_composite(self.shadow_layer)
-        self.final_image.alpha_composite(self.text_layer)
-        self.final_image.alpha_composite(self.titlebar_layer)
-        self.final_image = self.final_image.filter(ImageFilter.GaussianBlur(blur))
+        # reuse one scratch buffer across renders instead of copying the
+        # background layer into a fresh full-canvas image every time
+        if self._scratch is None:
+            self._scratch = Image.new("RGBA", (self.img_width, self.img_height))
+        if self.bg_layer is not None:
+            self._scratch.paste(self.bg_layer)
+        else:
+            self._scratch.paste(self._bg_color, (0, 0, self.img_width, self.img_height))
+        self._scratch.alpha_composite(self.shadow_layer)
+        self._scratch.alpha_composite(
+            self.text_layer, (self.cfg.margin, self.cfg.margin)
+        )
+        self._scratch.alpha_composite(self.titlebar_layer)
+        if blur:
+            self.final_image = self._scratch.filter(ImageFilter.GaussianBlur(blur))
+        else:  # a zero-radius blur would still run a full-image convolution
+            self.final_image = self._scratch
 
     def render(self, code=None):
         if code is None:
             code = " "
-        if self.bg_layer is None:
+        if self.bg_layer is None and self._bg_color is None:
             self.render_background_layer(
                 first_color=self.cfg.first_bg_color,
                 second_color=self.cfg.second_bg_color,
             )
         if self.shadow_layer is None:
-            self.render_shadow_layer(
-                shadow_offset=self.cfg.shadow_offset,
-                shadow_blur=self.cfg.shadow_blur,
-                shadow_color=self.cfg.shadow_color,
-                shadow_alpha=self.cfg.shadow_alpha,
-                corner_radius=self.cfg.corner_radius,
-            )
+            self.render_shadow_layer()
         if self.titlebar_layer is None:
             self.render_titlebar_layer()
         if self.text_layer is None or self._code != code:
@@ -261,37 +390,58 @@ class Render:
             self.render_text_layer(code, style=self.cfg.style)
         self.composit_layers(blur=self.cfg.post_blur)
 
-    def save_image(self, filename="rendered_code.png"):
+    def save_image(self, filename="rendered_code.png", compress_level=1):
+        """Save the rendered image as PNG.
+
+        The default compression level favors fast encoding for quick
+        iteration; pass a higher level (up to 9) for smaller files.
+        """
         if self.final_image is None:
             raise ValueError("You have to run .render() to create an image first.")
-        self.final_image.convert("RGBA").save(filename, "PNG")
+        self.final_image.save(filename, "PNG", compress_level=compress_level)
         print(f'Image saved to "{filename}".')
 
 
+def _render_file(filename, config_kwargs, output):
+    """Render a single source file to PNG; also the batch-mode worker."""
+    with open(filename, "r", encoding="utf-8") as f:
+        code = f.read()
+
+    render = Render(config=RenderConfig(**config_kwargs))
+    render.render(code=code)
+    render.save_image(output)
+
+
 def main():
     parser = get_argparser()
     args = parser.parse_args()
 
-    if args.file:
-        with open(args.file, "r", encoding="utf-8") as f:
-            code = f.read()
-    else:
-        if sys.stdin.isatty():
-            parser.print_help()
-            sys.exit(1)
-        else:
-            code = sys.stdin.read()
-
-    config = RenderConfig(
+    config_kwargs = dict(
         columns=args.columns,
         rows=args.rows,
         font_family=args.font,
         style=args.style,
     )
 
-    render = Render(
-        config=config,
-    )
+    if args.file and len(args.file) > 1:
+        # batch mode: PIL and Pygments work is CPU-bound, so distribute
+        # the files across processes; outputs are named after the inputs
+        outputs = [str(Path(f).with_suffix(".png")) for f in args.file]
+        with ProcessPoolExecutor() as executor:
+            # consume the iterator so worker exceptions propagate
+            list(executor.map(_render_file, args.file, repeat(config_kwargs), outputs))
+        return
+
+    if args.file:
+        _render_file(args.file[0], config_kwargs, args.output)
+        return
+
+    if sys.stdin.isatty():
+        parser.print_help()
+        sys.exit(1)
+    code = sys.stdin.read()
+
+    render = Render(config=RenderConfig(**config_kwargs))
 
     # Monokai-style purple gradient (dark to light purple)
     # end_color = (93, 80, 124)
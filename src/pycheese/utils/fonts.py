@@ -3,6 +3,7 @@ import os
 import re
 import tomllib
 from enum import Enum
+from functools import lru_cache
 from importlib.resources import as_file, files
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
@@ -15,6 +16,12 @@ def get_font_config_resource():
     return files("pycheese") / "fonts" / "font_config.toml"
 
 
+@lru_cache(maxsize=16)
+def _load_image_font(path, size):
+    """ImageFont.truetype re-parses the TTF on every call; cache per (path, size)."""
+    return ImageFont.truetype(path, size)
+
+
 class FontStyle(Enum):
     REGULAR = "regular"
     BOLD = "bold"
@@ -30,7 +37,6 @@ class Font:
         self.external_link = False
         self.font_dir = files("pycheese") / "fonts"
         self._set_paths_and_origin(config)
-        self.ImageFonts = {}
 
     def _set_paths_and_origin(self, config):
         try:
@@ -59,13 +65,7 @@ class Font:
                 self.font_paths[style] = font_path
 
     def get_ImageFont(self, size: int, style: str = "regular"):
-        if len(self.ImageFonts) > 20:  # prune cache
-            self.ImageFonts = {}
-        if not (style, size) in self.ImageFonts:
-            self.ImageFonts[(style, size)] = ImageFont.truetype(
-                self.font_paths[style], size
-            )
-        return self.ImageFonts[(style, size)]
+        return _load_image_font(self.font_paths[style], size)
 
     @classmethod
     def from_config_file(cls, family_name: str, path: Path):
@@ -1,44 +1,128 @@
+import math
+from functools import lru_cache
+
 from PIL import Image, ImageColor
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-def create_uniform_background(width, height, color="white"):
-    return Image.new("RGBA", (width, height), Color.from_any_color(color).rgba)
+try:  # optional JIT-compiled gradient kernel, worthwhile for large canvases
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
+# Gradient vector components
+_GRADIENT_ANGLE_RAD = math.radians(60)
+_GRADIENT_DX = math.cos(_GRADIENT_ANGLE_RAD)
+_GRADIENT_DY = math.sin(_GRADIENT_ANGLE_RAD)
 
-def create_gradient_background(width, height, start_color="coral", end_color="salmon"):
-    import math
+if njit is not None and np is not None:
 
-    start_color = Color.from_any_color(start_color).rgba
-    end_color = Color.from_any_color(end_color).rgba
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _fill_gradient(buf, width, height, dx, dy, offset, scale, start, end):
+        for y in prange(height):
+            for x in range(width):
+                norm = (x * dx + y * dy - offset) / scale
+                norm = min(1.0, max(0.0, norm))
+                for c in range(4):
+                    buf[y, x, c] = np.uint8(
+                        start[c] * (1 - norm) + end[c] * norm
+                    )
 
-    image = Image.new("RGBA", (width, height))
-    angle_rad = math.radians(60)
+else:
+    _fill_gradient = None
 
-    # Gradient vector components
-    dx = math.cos(angle_rad)
-    dy = math.sin(angle_rad)
 
-    for y in range(height):
-        for x in range(width):
-            # Project point (x, y) onto gradient direction vector
-            projection = x * dx + y * dy
-            # Normalize projection to range 0–1
-            normalized = (projection - min(0, dx * width + dy * height)) / (
-                abs(dx) * width + abs(dy) * height
-            )
-            normalized = max(0, min(1, normalized))  # Clamp to [0, 1]
+def create_uniform_background(width, height, color="white"):
+    return Image.new("RGBA", (width, height), Color.from_any_color(color).rgba)
 
-            # Interpolate colors
-            r = int(start_color[0] * (1 - normalized) + end_color[0] * normalized)
-            g = int(start_color[1] * (1 - normalized) + end_color[1] * normalized)
-            b = int(start_color[2] * (1 - normalized) + end_color[2] * normalized)
 
-            image.putpixel((x, y), (r, g, b))
+def create_gradient_background(width, height, start_color="coral", end_color="salmon"):
+    start_color = Color.from_any_color(start_color).rgba
+    end_color = Color.from_any_color(end_color).rgba
 
-    return image
+    dx, dy = _GRADIENT_DX, _GRADIENT_DY
+    offset = min(0, dx * width + dy * height)
+    scale = abs(dx) * width + abs(dy) * height
+
+    if _fill_gradient is not None:
+        # fused single-pass kernel, avoids the NumPy intermediates
+        buf = np.empty((height, width, 4), dtype=np.uint8)
+        _fill_gradient(
+            buf,
+            width,
+            height,
+            dx,
+            dy,
+            offset,
+            scale,
+            np.asarray(start_color, dtype=np.float32),
+            np.asarray(end_color, dtype=np.float32),
+        )
+        return Image.fromarray(buf, "RGBA")
+
+    if np is None:
+        # pure-Python fallback: fill a bytearray and hand it to PIL in one
+        # copy, instead of thousands of putpixel calls
+        buf = bytearray(width * height * 4)
+        sr, sg, sb, sa = start_color
+        dr = end_color[0] - sr
+        dg = end_color[1] - sg
+        db = end_color[2] - sb
+        da = end_color[3] - sa
+        o = 0
+        for y in range(height):
+            row_proj = y * dy - offset
+            for x in range(width):
+                norm = (x * dx + row_proj) / scale
+                norm = min(1.0, max(0.0, norm))
+                buf[o] = int(sr + dr * norm)
+                buf[o + 1] = int(sg + dg * norm)
+                buf[o + 2] = int(sb + db * norm)
+                buf[o + 3] = int(sa + da * norm)
+                o += 4
+        return Image.frombytes("RGBA", (width, height), bytes(buf))
+
+    # Project every pixel onto the gradient direction vector and normalize
+    # the projections to range 0–1, clamped to [0, 1]
+    xs = np.arange(width, dtype=np.float32)
+    ys = np.arange(height, dtype=np.float32)
+    projection = xs[None, :] * dx + ys[:, None] * dy
+    normalized = np.clip((projection - offset) / scale, 0, 1)
+
+    # Interpolate colors channel by channel
+    channels = [
+        (start_color[i] * (1 - normalized) + end_color[i] * normalized).astype(np.uint8)
+        for i in range(4)
+    ]
+    return Image.fromarray(np.dstack(channels), "RGBA")
+
+
+_RGB_TO_NAME = None
+
+
+def _rgb_to_name(rgb):
+    """Reverse lookup of a color name from an RGB tuple.
+
+    The lookup table is built lazily on first use so importing the module
+    does not pay for parsing the whole ImageColor colormap.
+    """
+    global _RGB_TO_NAME
+    if _RGB_TO_NAME is None:
+        _RGB_TO_NAME = {ImageColor.getrgb(name): name for name in ImageColor.colormap}
+    return _RGB_TO_NAME.get(rgb)
 
 
 class Color:
+    """An RGBA color value.
+
+    Instances are treated as immutable: nothing in the package mutates a
+    Color after construction, which lets from_any_color and from_str hand
+    out shared instances instead of copies.
+    """
+
     def __init__(self, red, green, blue, alpha=255):
         channels = ["red", "green", "blue", "alpha"]
         for name, value in zip(channels, [red, green, blue, alpha]):
@@ -72,15 +156,14 @@ class Color:
     @property
     def name(self):
         if self._name is None:
-            for name in ImageColor.colormap:
-                if ImageColor.getrgb(name) == (self.rgb):
-                    self._name = name
+            self._name = _rgb_to_name(self.rgb)
         return self._name
 
     def __repr__(self):
         return f"Color({self.red}, {self.green}, {self.blue}, {self.alpha})"
 
     @classmethod
+    @lru_cache(maxsize=64)
     def from_str(cls, color_str):
         """Color from name (e.g. \"white\") or hex (e.g. \"#2366ff\")."""
         color = cls(*ImageColor.getrgb(color_str))
@@ -91,10 +174,14 @@ class Color:
     @classmethod
     def from_any_color(cls, color):
         """Color can be a name, hex string, RGB/RGBA tuple, or Color instance."""
+        # fast path: plain RGB/RGBA tuples are the common case on the
+        # hot render paths, skip the isinstance chain for them
+        if type(color) is tuple:
+            if len(color) >= 3:
+                return cls(*color[:4])
+            raise ValueError("Tuple must be length 3 (RGB) or 4 (RGBA).")
         if isinstance(color, cls):
-            out_color = cls(color.red, color.green, color.blue, color.alpha)
-            out_color._name = color._name
-            return out_color
+            return color  # immutable, no need to copy
         elif isinstance(color, str):
             return cls.from_str(color)
         elif isinstance(color, tuple):
@@ -1,12 +1,37 @@
+import io
+import keyword
 import re
+import sys
+import tokenize as stdlib_tokenize
+from functools import lru_cache
 
 from pygments import lex
 from pygments.lexers import PythonLexer
 from pygments.styles import get_style_by_name
 from pygments.token import Token
 
+_LEADING_WS = re.compile(r"\s+")
 
-def get_token_text_style(style_def):
+_NEWLINE_TOKEN = ("\n", "#f8f8f2", "regular", Token.Text.Whitespace, 0)
+
+_STDLIB_TOKEN_TYPES = {
+    stdlib_tokenize.OP: Token.Operator,
+    stdlib_tokenize.STRING: Token.Literal.String,
+    stdlib_tokenize.NUMBER: Token.Literal.Number,
+    stdlib_tokenize.COMMENT: Token.Comment,
+    stdlib_tokenize.NEWLINE: Token.Text.Whitespace,
+    stdlib_tokenize.NL: Token.Text.Whitespace,
+    stdlib_tokenize.INDENT: Token.Text.Whitespace,
+}
+
+
+@lru_cache(maxsize=16)
+def _style_dict(style_name: str) -> dict:
+    """Resolve a pygments style name to its token style dict once per style."""
+    return dict(get_style_by_name(style_name))
+
+
+def get_token_text_style(style_def) -> str:
     """Get token style as string from list of booleans.
 
     For example {"bold": True, "italic": True} returns "bold_italic".
@@ -20,7 +45,9 @@ def get_token_text_style(style_def):
     return style_map[(style_def["bold"], style_def["italic"])]
 
 
-def tokenize(code, lexer, style="default", default_text_color="#000000"):
+def tokenize(
+    code: str, lexer, style: str = "default", default_text_color: str = "#000000"
+) -> list[tuple]:
     """Translates code into tokens with type setting attributes.
 
     # Token consist of the token value, color, text style, token type and
@@ -29,32 +56,109 @@ def tokenize(code, lexer, style="default", default_text_color="#000000"):
     Example:
         ('def', '#66d9ef', 'regular', Token.Keyword, 3)
     """
-    tokens = list(lex(code, lexer))
+    style_dict = _style_dict(style)
+
+    l = []
+    l_append = l.append  # skip the attribute lookup per token
+    resolved = {}  # a file has thousands of tokens but only tens of types
+    for tok_type, tok_val in lex(code, lexer):
+        setting = resolved.get(tok_type)
+        if setting is None:
+            setting = resolved[tok_type] = _token_type_setting(
+                style_dict, tok_type, default_text_color
+            )
+        color, text_style = setting
+        l_append(
+            (
+                tok_val,
+                color,
+                text_style,
+                tok_type,
+                len(tok_val.rstrip("\r\n")),
+            )
+        )
+    return l
+
+
+def _token_type_setting(style_dict, tok_type, default_text_color):
+    """Get color and text style (e.g. "bold") for a token type."""
+    # Get style attributes (color, bold, italic, etc.)
+    style_attrs = style_dict.get(tok_type) or style_dict.get(tok_type.parent) or ()
+    if style_attrs["color"] is None:
+        color = default_text_color
+    else:
+        # many token types share a palette color; interning lets every
+        # token carrying it reference one shared str
+        color = sys.intern("#" + style_attrs["color"])
+    return color, get_token_text_style(style_attrs)
+
+
+def tokenize_fast(
+    code: str, style: str = "default", default_text_color: str = "#000000"
+) -> list[tuple]:
+    """Tokenize Python code with the stdlib tokenizer instead of Pygments.
+
+    Produces the same 5-tuple shape as tokenize() but with coarser token
+    types, trading highlighting fidelity for the C-backed stdlib scanner.
+    Raises tokenize.TokenError or SyntaxError on malformed input; callers
+    should fall back to tokenize() in that case.
+    """
+    style_dict = _style_dict(style)
 
-    style = get_style_by_name(style)
-    style_dict = dict(style)
+    # absolute character offset of every line start, to recover the
+    # whitespace between consecutive stdlib tokens
+    offsets = [0]
+    for line in code.splitlines(keepends=True):
+        offsets.append(offsets[-1] + len(line))
+
+    whitespace_setting = _token_type_setting(
+        style_dict, Token.Text.Whitespace, default_text_color
+    )
 
     l = []
-    for tok_type, tok_val in tokens:
-        # Get style attributes (color, bold, italic, etc.)
-        style_attrs = style_dict.get(tok_type) or style_dict.get(tok_type.parent) or ()
-        if style_attrs["color"] is None:
-            color = default_text_color
+    pos = 0
+    resolved = {}  # a file has thousands of tokens but only tens of types
+    for tok in stdlib_tokenize.generate_tokens(io.StringIO(code).readline):
+        if not tok.string:
+            continue
+        if tok.type == stdlib_tokenize.NAME:
+            tok_type = Token.Keyword if keyword.iskeyword(tok.string) else Token.Name
         else:
-            color = "#" + style_attrs["color"]  # test if valid color
+            tok_type = _STDLIB_TOKEN_TYPES.get(tok.type, Token.Text)
+
+        start = offsets[tok.start[0] - 1] + tok.start[1]
+        if start > pos:  # gap between tokens, e.g. spaces around operators
+            gap = code[pos:start]
+            color, text_style = whitespace_setting
+            l.append(
+                (
+                    gap,
+                    color,
+                    text_style,
+                    Token.Text.Whitespace,
+                    len(gap.rstrip("\r\n")),
+                )
+            )
+        setting = resolved.get(tok_type)
+        if setting is None:
+            setting = resolved[tok_type] = _token_type_setting(
+                style_dict, tok_type, default_text_color
+            )
+        color, text_style = setting
         l.append(
             (
-                tok_val,
+                tok.string,
                 color,
-                get_token_text_style(style_attrs),
+                text_style,
                 tok_type,
-                len(tok_val.rstrip("\r\n")),
+                len(tok.string.rstrip("\r\n")),
             )
         )
+        pos = start + len(tok.string)
     return l
 
 
-def split_token(token, pos):
+def split_token(token: tuple, pos: int) -> list[tuple]:
     """Split a single token and insert a newline token at `pos`.
 
     Splitting at pos=0 will emit two tokens: a newline token and the original
@@ -75,30 +179,65 @@ def split_token(token, pos):
     if token[4] == 0:
         return [token]
 
-    newline_token = ("\n", "#f8f8f2", "regular", Token.Text.Whitespace, 0)
+    head, tail = _split_token_unchecked(token, pos)
+    return [t for t in (head, _NEWLINE_TOKEN, tail) if t[0]]
+
 
+def _split_token_unchecked(token: tuple, pos: int) -> tuple[tuple, tuple]:
+    """Split a token at `pos` into a (head, tail) pair, without checks.
+
+    Either part may carry an empty value; callers filter those and place
+    the shared _NEWLINE_TOKEN between the parts themselves, which spares
+    the intermediate list that the public split_token returns.
+    wrap_tokens only ever splits with 0 <= pos < token[4], so it also
+    skips the validation that the public function performs per call.
+    """
     head_value = token[0][:pos]
     tail_value = token[0][pos:]
-    head_printable_len = len(head_value.rstrip("\r\n"))
-    tail_printable_len = len(tail_value.rstrip("\r\n"))
+    # pos lies inside the printable prefix, so the head is all printable
+    # and the tail keeps the rest; no need to rstrip the parts again
+    head_printable_len = pos
+    tail_printable_len = token[4] - pos
 
     # remove leading spaces from tail token
-    match = re.match(r"\s+", tail_value)
+    match = _LEADING_WS.match(tail_value)
     leading_spaces = match.group() if match else ""
     if leading_spaces:
         tail_value = tail_value[len(leading_spaces) :]
         tail_printable_len -= len(leading_spaces)
 
-    out_tokens = [
+    return (
         (head_value, *token[1:4], head_printable_len),
-        newline_token,
         (tail_value, *token[1:4], tail_printable_len),
-    ]
-    # only return tokens with non-empty values
-    return [t for t in out_tokens if t[0]]
+    )
+
 
+def wrap_tokens(tokens: list[tuple], width: int = 80) -> list[list[tuple]]:
+    # fast path: most real code never overflows the terminal width, so
+    # check first and skip the split machinery when nothing wraps
+    char_count = 0
+    overflows = False
+    for token in tokens:
+        if token[0] == "\n":
+            char_count = 0
+        else:
+            char_count += token[4]
+            if char_count > width:
+                overflows = True
+                break
+
+    if not overflows:
+        single_row = []
+        rows = []
+        for token in tokens:
+            single_row.append(token)
+            if token[0] == "\n":
+                rows.append(single_row)
+                single_row = []
+        if single_row:
+            rows.append(single_row)
+        return rows
 
-def wrap_tokens(tokens, width=80):
     token_stack = tokens[::-1]
     single_row = []
     rows = []
@@ -108,9 +247,14 @@ def wrap_tokens(tokens, width=80):
         token = token_stack.pop()
 
         if char_count + token[4] > width:
-            pos = width - char_count
-            token, *tail = split_token(token, pos)
-            token_stack.extend(tail[::-1])
+            head, tail = _split_token_unchecked(token, width - char_count)
+            if tail[0]:
+                token_stack.append(tail)
+            if head[0]:
+                token_stack.append(_NEWLINE_TOKEN)
+                token = head
+            else:
+                token = _NEWLINE_TOKEN
 
         single_row.append(token)
         char_count += token[4]
@@ -126,6 +270,6 @@ def wrap_tokens(tokens, width=80):
     return rows
 
 
-def ruler(n=80):
+def ruler(n: int = 80) -> str:
     output = [f"{(i%16):x}" for i in range(n)]
     return "".join(output)
@@ -68,13 +68,14 @@ def test_from_rgba_tuple():
     assert color.hexa == "#0a141e80"
 
 
-def test_copy_color():
+def test_color_passthrough():
     original = Color.from_any_color("navy")
     copy = Color.from_any_color(original)
     assert copy.rgb == original.rgb
     assert copy.alpha == original.alpha
     assert copy.name == original.name
-    assert copy is not original
+    # Color is immutable, so the instance is handed back as-is
+    assert copy is original
 
 
 def test_invalid_tuple_length():
@@ -1,4 +1,5 @@
 import textwrap
+from tokenize import TokenError as TokenizeError
 
 import pytest
 from pygments.token import Token
@@ -36,6 +37,18 @@ def test_tokenize():
     assert result_monokai == expected_monokai
 
 
+def test_tokenize_fast_reconstructs_code():
+    code = "import os\nx = 1  # note\n"
+    result = tokenize_fast(code, style="monokai")
+    assert "".join(t[0] for t in result) == code
+    assert result[0][:2] == ("import", "#66d9ef")
+
+
+def test_tokenize_fast_malformed_code():
+    with pytest.raises((TokenizeError, SyntaxError)):
+        tokenize_fast("def broken(:\n    (", style="monokai")
+
+
 # @pytest.mark.parametrize("pos", [-1])
 def test_split_token_zero_printable_length():
     token = ("\n", "#f8f8f2", "regular", Token.Text.Whitespace, 0)